@@ -1,8 +1,9 @@
 import importlib
+import logging
 import sys
 
-print("<<<<<<<<<<<<<<<<<<<<<<<<<< sys.path >>>>>>>>>>>>>>>>>>>>>>>>>>")
-print(sys.path)
+log = logging.getLogger(__name__)
+
 
 def get_project_settings():
     """
@@ -11,9 +12,9 @@ def get_project_settings():
     """
     try:
         settings = importlib.import_module("settings")
-        print("<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<< settings >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>")
-        print(settings)
     except ModuleNotFoundError:
+        log.debug("No project settings module on sys.path %s", sys.path)
         from FastAPIBig.management import default_settings as settings  # Fallback to internal defaults
 
+    log.debug("Using settings %s", settings)
     return settings
@@ -1,12 +1,17 @@
+import logging
+
 from FastAPIBig.orm.base.base_model import ORMSession
 from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
 from FastAPIBig.conf.settings import get_project_settings
 
-settings = get_project_settings()
+log = logging.getLogger(__name__)
 
-# Use settings dynamically
-print(settings.DATABASE_URL)  # This will be the project's database setting
-print(settings.DEBUG)               # Project-defined debug setting
+settings = get_project_settings()
+log.debug("DEBUG=%s", settings.DEBUG)
 
-db_manager = DataBaseSessionManager(settings.DATABASE_URL)
+db_manager = DataBaseSessionManager(
+    settings.DATABASE_URL,
+    read_database_url=getattr(settings, "DATABASE_READ_URL", None),
+    **getattr(settings, "DATABASE_ENGINE_OPTIONS", {}),
+)
 ORMSession.initialize(db_manager)
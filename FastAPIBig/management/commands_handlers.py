@@ -7,10 +7,11 @@ from FastAPIBig.management.project_tables import create_project_tables
 def generate_routes_content(app_name):
     return f"""
 from fastapi import APIRouter
+from FastAPIBig.views.apis.responses import ORJSONResponse
 
 router = APIRouter()
 
-@router.get("/")
+@router.get("/", response_class=ORJSONResponse)
 def read_{app_name}():
     return {{"message": "{app_name} app"}}
 """
@@ -60,6 +61,7 @@ def start_server(
     port: int = 8000,
     reload: bool = True,
     workers: int | None = None,
+    loop: str = "auto",
 ):
     """Starts the FastAPI server."""
     uvicorn.run(
@@ -68,6 +70,7 @@ def start_server(
         port=port,
         reload=reload,
         workers=workers,
+        loop=loop,
     )
 
 
@@ -1,13 +1,16 @@
+import logging
 import os
 
 from FastAPIBig.management import db_manager
 
+log = logging.getLogger(__name__)
+
 
 def import_models():
 
     # Dynamically include routes
     apps_dir = os.path.join(os.getcwd(), "app")
-    print(apps_dir)
+    log.debug("Importing models from %s", apps_dir)
 
     # For feature-based structure
     if os.path.exists(apps_dir):
@@ -17,9 +20,9 @@ def import_models():
                 try:
                     module_name = f"app.{app_name}.models"
                     __import__(module_name)
-                    print(module_name)
+                    log.debug("Imported %s", module_name)
                 except (ModuleNotFoundError, AttributeError) as e:
-                    print(e)
+                    log.debug("Skipping %s: %s", module_name, e)
 
     # For type-based structure
     routes_dir = os.path.join(apps_dir, "routes")
@@ -29,9 +32,9 @@ def import_models():
                 try:
                     module_name = f"app.models.{route_file[:-3]}"
                     __import__(module_name)
-                    print(module_name)
+                    log.debug("Imported %s", module_name)
                 except (ModuleNotFoundError, AttributeError) as e:
-                    print(e)
+                    log.debug("Skipping %s: %s", module_name, e)
 
 
 async def create_project_tables():
@@ -1,15 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import inspect, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import (
     declarative_base,
-    Session,
+    joinedload,
+    selectinload,
 )
-from typing import AsyncIterator, Optional, Type, Any, Iterator
+from typing import AsyncContextManager, AsyncIterator, Optional, Type, Any
 from sqlalchemy.sql.functions import count
 from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
 
-
-DECLARATIVE_BASE = declarative_base()
+# Dialects whose INSERT supports ON CONFLICT ... DO UPDATE, used by ORM.save.
+UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
 
 
 class ORMSession:
@@ -21,99 +24,213 @@ class ORMSession:
         cls._db_manager = db_manager
 
     @classmethod
-    async def _async_session(cls) -> AsyncIterator[AsyncSession]:
-        """Get an async session."""
+    def _get_db_manager(cls) -> "DataBaseSessionManager":
         if cls._db_manager is None:
             raise Exception("DataBaseSessionManager is not initialized for Base.")
-        async with cls._db_manager.async_session() as session:
-            yield session
+        return cls._db_manager
 
-    @classmethod
-    def _sync_session(cls) -> Iterator[Session]:
-        """Get an async session."""
-        if cls._db_manager is None:
-            raise Exception("DataBaseSessionManager is not initialized for Base.")
-        with cls._db_manager.sync_session() as session:
-            yield session
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency providing one session (and transaction) per request.
+    Declare it with `Depends(get_session, scope="function")` so the commit runs
+    before the response is sent; a failed commit then surfaces as an error.
+    """
+    async with ORMSession._get_db_manager().async_session() as session:
+        yield session
+
+
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency providing an autocommit session for read-only requests."""
+    async with ORMSession._get_db_manager().async_read_session() as session:
+        yield session
+
+
+class _BoundSession:
+    """Hand out an already open session without closing or committing it."""
+
+    __slots__ = ("session",)
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def __aenter__(self) -> AsyncSession:
+        return self.session
+
+    async def __aexit__(self, *exc_info):
+        return None
 
 
 class ORM(ORMSession):
-    def __init__(self, model: Type["DECLARATIVE_BASE"]):
+    def __init__(
+        self, model: Type["DECLARATIVE_BASE"], session: Optional[AsyncSession] = None
+    ):
         self.model = model
+        self.session = session
+
+    def __call__(self, session: AsyncSession) -> "ORM":
+        """Return an ORM for the same model bound to the given session."""
+        return ORM(model=self.model, session=session)
+
+    def _session(self, read: bool = False) -> AsyncContextManager[AsyncSession]:
+        """Use the bound session, or open a short-lived one when none was given."""
+        if self.session is not None:
+            return _BoundSession(self.session)
+        if read:
+            return self._get_db_manager().async_read_session()
+        return self._get_db_manager().async_session()
 
     async def create(self, **kwargs):
-        """Create a new record."""
-        async for db_session in self._async_session():
+        """Create a new record; generated values come back via RETURNING on flush."""
+        async with self._session() as db_session:
             instance = self.model(**kwargs)
             db_session.add(instance)
-            await db_session.commit()
-            await db_session.refresh(instance)
+            await db_session.flush()
             return instance
 
+    async def bulk_create(self, rows: list[dict[str, Any]]):
+        """Create many records, flushed together and returned in the order given."""
+        async with self._session() as db_session:
+            instances = [self.model(**row) for row in rows]
+            db_session.add_all(instances)
+            await db_session.flush()
+            return instances
+
     async def get(self, pk: int):
-        """Retrieve a record by ID."""
-        for db_session in self._sync_session():
-            result = db_session.execute(select(self.model).filter(self.model.id == pk))
-            return result.scalars().first()
+        """Retrieve a record by ID, reusing the session's identity map when possible."""
+        async with self._session(read=True) as db_session:
+            return await db_session.get(self.model, pk)
 
     async def update(self, pk, **kwargs):
-        """Update a record by ID."""
-        async for db_session in self._async_session():
-            instance = await db_session.get(self.model, pk)
-            if not instance:
-                return None
-            for key, value in kwargs.items():
-                setattr(instance, key, value)
-            await db_session.commit()
-            await db_session.refresh(instance)
-            return instance
+        """Update a record by ID; plain column values use one UPDATE ... RETURNING."""
+        async with self._session() as db_session:
+            if not kwargs:
+                return await db_session.get(self.model, pk)  # Nothing to update
+            if not kwargs.keys() <= self._get_column_update_keys():
+                instance = await db_session.get(self.model, pk)
+                if not instance:
+                    return None
+                for key, value in kwargs.items():
+                    setattr(instance, key, value)
+                await db_session.flush()
+                return instance
+            result = await db_session.execute(
+                update(self.model)
+                .where(self.model.id == pk)
+                .values(**kwargs)
+                .returning(self.model)
+            )
+            return result.scalar_one_or_none()
 
     async def delete(self, pk, model=None):
         """Delete a record by ID."""
         model = model or self.model
-        async for db_session in self._async_session():
+        async with self._session() as db_session:
             instance = await db_session.get(model, pk)
             if not instance:
                 return False
             await db_session.delete(instance)
-            await db_session.commit()
+            await db_session.flush()
             return True
 
     async def save(self, model=None):
+        """Insert or update an instance, upserting in one statement where supported."""
         model = model or self.model
-        async for db_session in self._async_session():
-            merged_instance = await db_session.merge(
-                model
-            )  # Ensures no duplicate sessions
-            await db_session.commit()
-            await db_session.refresh(merged_instance)
-            return merged_instance  # Return the updated instance
+        async with self._session() as db_session:
+            upsert_insert = UPSERT_INSERTS.get(db_session.get_bind().dialect.name)
+            state = inspect(model)
+            mapper = state.mapper
+            if upsert_insert is None or not self._can_upsert(mapper):
+                return await self._merge(db_session, model)
+
+            table = mapper.local_table
+            values = {}
+            set_ = {}
+            onupdate = {}
+            for prop in mapper.column_attrs:
+                column = prop.columns[0]
+                if not table.c.contains_column(column):
+                    continue  # column_property expressions, inherited columns
+                changed = state.attrs[prop.key].history.has_changes()
+                if prop.key in state.dict:
+                    values[column] = state.dict[prop.key]
+                    # Like a flush, only write what changed; writing a stale value
+                    # back would undo a concurrent update to that column.
+                    if changed and column not in mapper.primary_key:
+                        set_[column] = state.dict[prop.key]
+                # Like a flush, onupdate applies unless the value was changed.
+                if column.onupdate is not None and not changed:
+                    onupdate[column] = column.onupdate.arg
+            if state.key is not None and not set_:
+                # Nothing to write for a persistent instance; a flush sends no SQL.
+                return await self._merge(db_session, model)
+
+            set_.update(onupdate)
+            stmt = upsert_insert(mapper.class_).values(values)
+            set_ = set_ or {
+                column: stmt.excluded[column.name] for column in mapper.primary_key
+            }
+            stmt = (
+                stmt.on_conflict_do_update(index_elements=mapper.primary_key, set_=set_)
+                .returning(mapper.class_)
+                .execution_options(populate_existing=True)
+            )
+            # The upsert writes the pending changes itself; don't flush them first.
+            with db_session.no_autoflush:
+                result = await db_session.execute(stmt)
+            return result.scalar_one()  # Return the updated instance
+
+    @staticmethod
+    async def _merge(db_session: AsyncSession, model):
+        merged_instance = await db_session.merge(model)  # Ensures no duplicate sessions
+        await db_session.flush()
+        return merged_instance  # Return the updated instance
+
+    @staticmethod
+    def _can_upsert(mapper) -> bool:
+        """
+        Whether save() can use a single upsert for this mapper.
+        Version counters, inheritance and Python-side onupdate callables need
+        the unit of work, so those models keep merge() + flush().
+        """
+        if mapper.version_id_col is not None:
+            return False
+        if mapper.inherits is not None or mapper.polymorphic_on is not None:
+            return False
+        return not any(
+            column.onupdate is not None and column.onupdate.is_callable
+            for column in mapper.local_table.c
+        )
 
     async def all(self):
         """Retrieve all records."""
-        async for db_session in self._async_session():
-            query = select(self.model)
-            result = await db_session.execute(query)
+        model = self.model
+        async with self._session(read=True) as db_session:
+            # lambda_stmt caches the built statement, keyed on the lambda and model.
+            result = await db_session.execute(lambda_stmt(lambda: select(model)))
             return result.scalars().all()
 
     async def filter(self, **filters):
         """Filter records by criteria."""
-        async for db_session in self._async_session():
+        async with self._session(read=True) as db_session:
             query = select(self.model).where(*self._filter_conditions(filters))
             result = await db_session.execute(query)
             return result.scalars().all()
 
     async def first(self, **filters):
         """Retrieve the first record matching the criteria."""
-        async for db_session in self._async_session():
+        async with self._session(read=True) as db_session:
             query = select(self.model).where(*self._filter_conditions(filters))
             result = await db_session.execute(query)
             return result.scalars().first()
 
     async def count(self):
         """Count all records."""
-        async for db_session in self._async_session():
-            result = await db_session.execute(select(count()).select_from(self.model))
+        model = self.model
+        async with self._session(read=True) as db_session:
+            result = await db_session.execute(
+                lambda_stmt(lambda: select(count()).select_from(model))
+            )
             return result.scalar()
 
     async def exists(self, **filters):
@@ -121,35 +238,97 @@ class ORM(ORMSession):
         return await self.first(**filters) is not None
 
     async def execute_query(self, query):
-        async for db_session in self._async_session():
+        async with self._session() as db_session:
             result = await db_session.execute(query)
             return result
 
+    def _get_filter_attrs(self) -> dict[str, Any]:
+        """Map attribute names to the model's instrumented attributes, built once."""
+        if self.model._filter_attrs is None:
+            self.model._filter_attrs = {
+                key: getattr(self.model, key)
+                for key in self.model.__mapper__.all_orm_descriptors.keys()
+            }
+        return self.model._filter_attrs
+
+    def _get_column_update_keys(self) -> frozenset[str]:
+        """Names of table columns without @validates hooks, built once."""
+        if self.model._column_update_keys is None:
+            mapper = self.model.__mapper__
+            self.model._column_update_keys = frozenset(
+                prop.key
+                for prop in mapper.column_attrs
+                if mapper.local_table.c.contains_column(prop.columns[0])
+                and prop.key not in mapper.validators
+            )
+        return self.model._column_update_keys
+
+    def _get_relationship_names(self) -> frozenset[str]:
+        """Names of the model's relationships, built once."""
+        if self.model._relationship_names is None:
+            self.model._relationship_names = frozenset(
+                self.model.__mapper__.relationships.keys()
+            )
+        return self.model._relationship_names
+
+    # This only builds SQL expressions; the time goes to the database round trip.
+    # Don't JIT it (e.g. Numba): there is no numeric loop to speed up, and the
+    # compile/dispatch overhead would cost more. Repeat queries are served by the
+    # engine's compiled-statement cache and asyncpg's prepared-statement cache.
     def _filter_conditions(self, filtered_fields: dict[str, Any] = None):
-        filter_conditions = []
-        fields = filtered_fields or {}
-        for attr, value in fields.items():
-            if hasattr(self.model, attr):
-                filter_conditions.append(getattr(self.model, attr) == value)
-            else:
-                raise AttributeError(
-                    f"Model {self.model.__name__} does not have '{attr}' attribute"
-                )
-        return filter_conditions
+        filter_attrs = self._get_filter_attrs()
+        try:
+            return [
+                filter_attrs[attr] == value
+                for attr, value in (filtered_fields or {}).items()
+            ]
+        except KeyError as e:
+            raise AttributeError(
+                f"Model {self.model.__name__} does not have '{e.args[0]}' attribute"
+            ) from None
 
     async def select_related(self, attrs: list[str] = None, **kwargs):
+        """Retrieve the first matching record with its relationships eagerly loaded."""
         attrs = attrs or []
+        missing = set(attrs) - self._get_relationship_names()
+        if missing:
+            raise AttributeError(
+                f"Model {self.model.__name__} does not have relationships: "
+                f"{sorted(missing)}"
+            )
+        relationships = self.model.__mapper__.relationships
+        options = []
         for attr in attrs:
-            if not hasattr(self.model, attr):
-                raise AttributeError(
-                    f"Model {self.__name__} does not have '{attr}' attribute"
-                )
-        async for db_session in self._async_session():
+            # Collections are loaded with one extra IN query, to-one via a JOIN.
+            loader = selectinload if relationships[attr].uselist else joinedload
+            options.append(loader(getattr(self.model, attr)))
+        async with self._session(read=True) as db_session:
             result = await db_session.execute(
-                select(self.model).filter(*self._filter_conditions(kwargs))
+                select(self.model)
+                .options(*options)
+                .where(*self._filter_conditions(kwargs))
             )
-            instance = result.scalars().first()
-            if not instance:
-                return None
-            await db_session.refresh(instance, attrs)
-            return instance
+            return result.scalars().first()
+
+
+class BaseORM:
+    """Base for declarative models; builds each model's `objects` ORM once."""
+
+    # Load server-generated values with RETURNING as part of the INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
+
+    objects: "ORM"
+    _filter_attrs: Optional[dict[str, Any]]
+    _relationship_names: Optional[frozenset[str]]
+    _column_update_keys: Optional[frozenset[str]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.objects = ORM(model=cls)
+        # Filled in by ORM on first use, once the model is mapped
+        cls._filter_attrs = None
+        cls._relationship_names = None
+        cls._column_update_keys = None
+
+
+DECLARATIVE_BASE = declarative_base(cls=BaseORM)
@@ -0,0 +1,86 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class AsyncBatcher(ABC):
+    """
+    Coalesce concurrent calls into batches.
+    - Callers await `process(item)` and get back their own result.
+    - Items are collected until `max_batch_size` is reached or `flush_interval`
+      seconds pass, then handed to `process_batch` in one call.
+    - If a batch fails, its items are retried one at a time with `process_item`,
+      so only the callers whose items fail get an exception.
+    """
+
+    def __init__(self, max_batch_size: int = 128, flush_interval: float = 0.002):
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def process(self, item: Any) -> Any:
+        """Queue an item and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_interval, self._flush)
+        return await future
+
+    @abstractmethod
+    async def process_batch(self, batch: list[Any]) -> list[Any]:
+        """Process a batch and return one result per item, in the same order."""
+
+    async def process_item(self, item: Any) -> Any:
+        """Process a single item; used to isolate failures after a batch fails."""
+        [result] = await self._process_batch_checked([item])
+        return result
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._tasks.add(task)  # Keep a reference until the batch is done
+            task.add_done_callback(self._tasks.discard)
+
+    async def _process_batch_checked(self, items: list[Any]) -> list[Any]:
+        results = await self.process_batch(items)
+        if len(results) != len(items):
+            raise ValueError(
+                f"process_batch returned {len(results)} results "
+                f"for {len(items)} items"
+            )
+        return results
+
+    async def _run_batch(self, batch: list[tuple[Any, asyncio.Future]]):
+        try:
+            results = await self._process_batch_checked([item for item, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            await self._run_items(batch)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run_items(self, batch: list[tuple[Any, asyncio.Future]]):
+        for item, future in batch:
+            if future.done():
+                continue
+            try:
+                result = await self.process_item(item)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
@@ -1,31 +1,87 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, Session
 import contextlib
-from typing import AsyncIterator, Any
-from sqlalchemy import create_engine, NullPool
+from typing import AsyncIterator, Any, Optional
+from sqlalchemy import create_engine, event, NullPool
+from sqlalchemy.engine import make_url
+
+
+def get_engine_options(database_url: str, **overrides: Any) -> dict[str, Any]:
+    """Build the async engine options for a database URL; ``overrides`` win."""
+    url = make_url(database_url)
+    options: dict[str, Any] = {"pool_pre_ping": True, "query_cache_size": 4096}
+    # SQLite serializes writes, and a custom poolclass (e.g. NullPool) may not be sized.
+    if url.get_backend_name() != "sqlite" and "poolclass" not in overrides:
+        options.update(pool_size=20, max_overflow=10)
+    if url.get_driver_name() == "asyncpg":
+        # Reuse server-side prepared statements instead of re-parsing identical queries.
+        options["connect_args"] = {
+            "prepared_statement_cache_size": 1024,
+            "statement_cache_size": 1024,
+        }
+    options.update(overrides)
+    return options
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL with relaxed fsync on every new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
 
 
 class DataBaseSessionManager:
     def __init__(
             self,
             database_url: str,
+            read_database_url: Optional[str] = None,
             **kwargs: Any
     ):
         """Initialize both async and sync database engines and sessionmakers."""
         # Async Engine & Session
         self._async_engine = create_async_engine(
-            url=database_url,
+            url=database_url, **get_engine_options(database_url, **kwargs)
         )
         self._async_sessionmaker = async_sessionmaker(
             bind=self._async_engine, expire_on_commit=False, class_=AsyncSession
         )
+        if make_url(database_url).get_backend_name() == "sqlite":
+            event.listen(self._async_engine.sync_engine, "connect", set_sqlite_pragmas)
 
+        # Read Engine & Session: autocommit, so reads never open a transaction.
+        # Without a replica URL it shares the primary engine's pool.
+        self._has_read_replica = bool(read_database_url)
+        if self._has_read_replica:
+            self._async_read_engine = create_async_engine(
+                url=read_database_url,
+                **get_engine_options(
+                    read_database_url, isolation_level="AUTOCOMMIT", **kwargs
+                ),
+            )
+            if make_url(read_database_url).get_backend_name() == "sqlite":
+                event.listen(
+                    self._async_read_engine.sync_engine, "connect", set_sqlite_pragmas
+                )
+        else:
+            self._async_read_engine = self._async_engine.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+        self._async_read_sessionmaker = async_sessionmaker(
+            bind=self._async_read_engine, expire_on_commit=False, class_=AsyncSession
+        )
 
     async def close(self):
-        """Dispose of the async engine."""
+        """Dispose of the async engines."""
         await self._async_engine.dispose()
+        if self._has_read_replica:
+            await self._async_read_engine.dispose()
         self._async_engine = None
         self._async_sessionmaker = None
+        self._async_read_engine = None
+        self._async_read_sessionmaker = None
 
     async def create_all_tables(self, base):
         """Create all tables asynchronously."""
@@ -44,3 +100,11 @@ class DataBaseSessionManager:
             except Exception as e:
                 await session.rollback()
                 raise e
+
+    @contextlib.asynccontextmanager
+    async def async_read_session(self) -> AsyncIterator[AsyncSession]:
+        """Provide an async session for reads; nothing is committed."""
+        if self._async_read_sessionmaker is None:
+            raise Exception("DataBaseSessionManager is not initialized")
+        async with self._async_read_sessionmaker() as session:
+            yield session
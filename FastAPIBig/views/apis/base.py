@@ -38,7 +38,7 @@ class BaseAPI:
     request: Request
 
     def __init__(self, router: Optional[APIRouter] = None):
-        self._model = ORM(model=self.model)
+        self._model: ORM = self.model.objects
 
         class Wrapper:
             pass
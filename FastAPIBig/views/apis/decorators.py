@@ -3,20 +3,23 @@ from fastapi import HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Type, Callable
 
+from FastAPIBig.orm.base.base_model import get_session
+
 
 def api_view(model: Type["ORM"]):
     """
     A decorator for handling common CRUD operations in FastAPI routes.
     - Detects CRUD type from function name (`create`, `get`, `update`, `delete`).
     - Uses SQLAlchemy ORM methods.
-    - Injects async session automatically.
+    - Injects the request-scoped async session, committed once per request
+      before the response is sent.
     """
 
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(
             *args,
-            db_session: AsyncSession = Depends(model._db_manager.session),
+            db_session: AsyncSession = Depends(get_session, scope="function"),
             **kwargs
         ):
             operation = func.__name__.lower()
@@ -31,8 +34,7 @@ def api_view(model: Type["ORM"]):
             if operation == "create":
                 instance = model(**kwargs)
                 db_session.add(instance)
-                await db_session.commit()
-                await db_session.refresh(instance)
+                await db_session.flush()
                 return instance
 
             elif operation == "get":
@@ -47,8 +49,7 @@ def api_view(model: Type["ORM"]):
                     raise HTTPException(status_code=404, detail="Not found")
                 for key, value in kwargs.items():
                     setattr(instance, key, value)
-                await db_session.commit()
-                await db_session.refresh(instance)
+                await db_session.flush()
                 return instance
 
             elif operation == "delete":
@@ -56,7 +57,7 @@ def api_view(model: Type["ORM"]):
                 if not instance:
                     raise HTTPException(status_code=404, detail="Not found")
                 await db_session.delete(instance)
-                await db_session.commit()
+                await db_session.flush()
                 return {"message": "Deleted successfully"}
 
             return await func(*args, **kwargs)  # Default to normal function execution
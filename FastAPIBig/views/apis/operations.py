@@ -1,6 +1,8 @@
 import asyncio
+from functools import lru_cache
+from typing import List, Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from FastAPIBig.views.apis.base import (
     RegisterCreate,
     RegisterRetrieve,
@@ -9,19 +11,33 @@ from FastAPIBig.views.apis.base import (
     RegisterPartialUpdate,
     RegisterUpdate,
 )
-from fastapi import Request
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from FastAPIBig.orm.base.base_model import get_read_session, get_session
+
+
+@lru_cache
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Build the list validator for a schema once and reuse it."""
+    return TypeAdapter(List[schema])
 
 
 class CreateOperation(RegisterCreate):
 
-    async def create(self, request: Request, data: BaseModel):
+    async def create(
+        self,
+        request: Request,
+        data: BaseModel,
+        session: AsyncSession = Depends(get_session, scope="function"),
+    ):
         await self.pre_create(request, data)
-        instance = await self._create(request, data)
+        instance = await self._create(request, data, session)
         asyncio.create_task(self.on_create(request, instance))
-        return self.schema_out.model_validate(instance.__dict__)
+        return self.schema_out.model_validate(instance, from_attributes=True)
 
-    async def _create(self, request: Request, data: BaseModel):
-        return await self._model.create(**data.model_dump())
+    async def _create(self, request: Request, data: BaseModel, session: AsyncSession):
+        return await self._model(session).create(**data.model_dump())
 
     async def pre_create(self, request: Request, data: BaseModel):
         pass
@@ -32,14 +48,19 @@ class CreateOperation(RegisterCreate):
 
 class RetrieveOperation(RegisterRetrieve):
 
-    async def get(self, request: Request, pk: int):
+    async def get(
+        self,
+        request: Request,
+        pk: int,
+        session: AsyncSession = Depends(get_read_session),
+    ):
         await self.pre_get(request, pk)
-        instance = await self._get(request, pk)
+        instance = await self._get(request, pk, session)
         asyncio.create_task(self.on_get(request, instance))
-        return self.schema_out.model_validate(instance.__dict__)
+        return self.schema_out.model_validate(instance, from_attributes=True)
 
-    async def _get(self, request: Request, pk: int):
-        return await self._model.get(pk=pk)
+    async def _get(self, request: Request, pk: int, session: AsyncSession):
+        return await self._model(session).get(pk=pk)
 
     async def pre_get(self, request: Request, pk: int):
         pass
@@ -50,17 +71,26 @@ class RetrieveOperation(RegisterRetrieve):
 
 class UpdateOperation(RegisterUpdate):
 
-    async def update(self, request: Request, pk: int, data: BaseModel):
+    async def update(
+        self,
+        request: Request,
+        pk: int,
+        data: BaseModel,
+        session: AsyncSession = Depends(get_session, scope="function"),
+    ):
         await self.pre_update(request, pk, data)
-        instance = await self._update(request, pk, data)
+        instance = await self._update(request, pk, data, session)
         asyncio.create_task(self.on_update(request, instance))
-        return self.schema_out.model_validate(instance.__dict__)
+        return self.schema_out.model_validate(instance, from_attributes=True)
 
-    async def _update(self, request: Request, pk: int, data: BaseModel):
-        instance = await self._model.get(pk=pk)
+    async def _update(
+        self, request: Request, pk: int, data: BaseModel, session: AsyncSession
+    ):
+        orm = self._model(session)
+        instance = await orm.get(pk=pk)
         for key, value in data.model_dump().items():
             setattr(instance, key, value)
-        await self._model.save(instance)
+        await orm.save(instance)
         return instance
 
     async def pre_update(self, request: Request, pk: int, data: BaseModel):
@@ -72,17 +102,26 @@ class UpdateOperation(RegisterUpdate):
 
 class PartialUpdateOperation(RegisterPartialUpdate):
 
-    async def partial_update(self, request: Request, pk: int, data: BaseModel):
+    async def partial_update(
+        self,
+        request: Request,
+        pk: int,
+        data: BaseModel,
+        session: AsyncSession = Depends(get_session, scope="function"),
+    ):
         await self.pre_update(request, pk, data)
-        instance = await self._partial_update(request, pk, data)
+        instance = await self._partial_update(request, pk, data, session)
         asyncio.create_task(self.on_update(request, instance))
-        return self.schema_out.model_validate(instance.__dict__)
+        return self.schema_out.model_validate(instance, from_attributes=True)
 
-    async def _partial_update(self, request: Request, pk: int, data: BaseModel):
-        instance = await self._model.get(pk=pk)
+    async def _partial_update(
+        self, request: Request, pk: int, data: BaseModel, session: AsyncSession
+    ):
+        orm = self._model(session)
+        instance = await orm.get(pk=pk)
         for key, value in data.model_dump(exclude_unset=True).items():
             setattr(instance, key, value)
-        await self._model.save(instance)
+        await orm.save(instance)
         return instance
 
     async def pre_update(self, request: Request, pk: int, data: BaseModel):
@@ -94,14 +133,20 @@ class PartialUpdateOperation(RegisterPartialUpdate):
 
 class DeleteOperation(RegisterDelete):
 
-    async def delete(self, request: Request, pk: int):
+    async def delete(
+        self,
+        request: Request,
+        pk: int,
+        session: AsyncSession = Depends(get_session, scope="function"),
+    ):
         await self.pre_delete(request, pk)
-        instance = await self._delete(request, pk)
+        instance = await self._delete(request, pk, session)
         asyncio.create_task(self.on_delete(request, instance))
 
-    async def _delete(self, request: Request, pk: int):
-        instance = await self._model.get(pk=pk)
-        await self._model.delete(pk)
+    async def _delete(self, request: Request, pk: int, session: AsyncSession):
+        orm = self._model(session)
+        instance = await orm.get(pk=pk)
+        await orm.delete(pk)
         return instance
 
     async def pre_delete(self, request: Request, pk: int):
@@ -113,16 +158,18 @@ class DeleteOperation(RegisterDelete):
 
 class ListOperation(RegisterList):
 
-    async def list(self, request: Request):
+    async def list(
+        self, request: Request, session: AsyncSession = Depends(get_read_session)
+    ):
         await self.pre_list(request)
-        instances = await self._list(request)
+        instances = await self._list(request, session)
         asyncio.create_task(self.on_list(request))
-        return [
-            self.schema_out.model_validate(instance.__dict__) for instance in instances
-        ]
+        return _list_adapter(self.schema_out).validate_python(
+            instances, from_attributes=True
+        )
 
-    async def _list(self, request: Request):
-        return await self._model.all()
+    async def _list(self, request: Request, session: AsyncSession):
+        return await self._model(session).all()
 
     async def pre_list(self, request: Request):
         pass
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from .models import Post
 from .schemas import PostSchemaIn, PostSchemaOut
 from FastAPIBig.views.apis.operations import APIView
+from FastAPIBig.views.apis.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
 from typing import Annotated
 
@@ -9,7 +10,7 @@ from typing import Annotated
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_class=ORJSONResponse)
 async def read_posts():
     return {"message": "posts app"}
 
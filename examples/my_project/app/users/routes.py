@@ -1,16 +1,33 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from .models import User
-from .schemas import UserSchemaIn, UserSchemaOut, CreateUserSchema
+from .schemas import UserSchemaIn, UserSchemaOut, CreateUserSchema, USER_OUT
+from FastAPIBig.orm.base.base_model import get_read_session
+from FastAPIBig.orm.base.batcher import AsyncBatcher
 from FastAPIBig.views.apis.operations import APIView
+from FastAPIBig.views.apis.responses import ORJSONResponse
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_class=ORJSONResponse)
 def read_users():
     return {"message": "users app"}
 
 
+class UserCreateBatcher(AsyncBatcher):
+    """
+    Insert users created by concurrent requests in a single flush.
+    - Each batch, and each retried item, runs in its own session.
+    """
+
+    async def process_batch(self, batch):
+        return await User.objects.bulk_create(batch)
+
+
+user_create_batcher = UserCreateBatcher(max_batch_size=128, flush_interval=0.002)
+
+
 class UserView(APIView):
     model = User
     schema_in = UserSchemaIn
@@ -20,14 +37,16 @@ class UserView(APIView):
     get_methods = ["get_user"]
 
     async def create_user(self, create_data: CreateUserSchema):
-        instance = await self.model.objects.create(
-            name=create_data.name, email=create_data.email
+        instance = await user_create_batcher.process(
+            create_data.model_dump(include={"name", "email"})
         )
-        return self.schema_out.model_validate(instance.__dict__)
+        return USER_OUT.validate_python(instance, from_attributes=True)
 
-    async def get_user(self, pk: int):
-        user = await self.model.objects.select_related(id=pk, attrs=["posts"])
-        return self.schema_out.model_validate(user.__dict__)
+    async def get_user(
+        self, pk: int, session: AsyncSession = Depends(get_read_session)
+    ):
+        user = await self.model.objects(session).select_related(id=pk, attrs=["posts"])
+        return USER_OUT.validate_python(user, from_attributes=True)
 
 
 router.include_router(UserView.as_router(prefix="/users", tags=["Users"]))
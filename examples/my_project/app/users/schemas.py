@@ -1,12 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class UserSchemaIn(BaseModel):
     name: str
     email: str
 
-    class Config:
-        from_attributes = True  # Enable compatibility with SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)  # Read fields from SQLAlchemy models
 
 
 class CreateUserSchema(BaseModel):
@@ -14,8 +13,7 @@ class CreateUserSchema(BaseModel):
     email: str
     password: str
 
-    class Config:
-        from_attributes = True  # Enable compatibility with SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)  # Read fields from SQLAlchemy models
 
 
 class UserSchemaOut(BaseModel):
@@ -23,5 +21,8 @@ class UserSchemaOut(BaseModel):
     name: str
     email: str
 
-    class Config:
-        from_attributes = True  # Enable compatibility with SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)  # Read fields from SQLAlchemy models
+
+
+# Built once at import so responses run the compiled validator directly
+USER_OUT = TypeAdapter(UserSchemaOut)
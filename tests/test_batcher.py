@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from FastAPIBig.orm.base.batcher import AsyncBatcher
+
+
+class DoublingBatcher(AsyncBatcher):
+    """Doubles numbers; a batch containing a negative number fails as a whole."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    async def process_batch(self, batch):
+        self.batches.append(list(batch))
+        if any(item < 0 for item in batch):
+            raise ValueError(f"negative item in {batch}")
+        return [item * 2 for item in batch]
+
+
+async def _gather(batcher, items):
+    return await asyncio.gather(
+        *(batcher.process(item) for item in items), return_exceptions=True
+    )
+
+
+def test_concurrent_calls_share_one_batch():
+    batcher = DoublingBatcher(max_batch_size=128, flush_interval=0.01)
+
+    results = asyncio.run(_gather(batcher, [1, 2, 3, 4, 5]))
+
+    assert results == [2, 4, 6, 8, 10]
+    assert batcher.batches == [[1, 2, 3, 4, 5]]
+
+
+def test_results_come_back_in_input_order():
+    batcher = DoublingBatcher(max_batch_size=4, flush_interval=0.01)
+    items = list(range(10, 0, -1))
+
+    results = asyncio.run(_gather(batcher, items))
+
+    assert results == [item * 2 for item in items]
+    assert [len(batch) for batch in batcher.batches] == [4, 4, 2]
+
+
+def test_failed_batch_only_fails_the_bad_item():
+    batcher = DoublingBatcher(max_batch_size=128, flush_interval=0.01)
+
+    results = asyncio.run(_gather(batcher, [1, 2, -3, 4, 5]))
+
+    assert [results[i] for i in (0, 1, 3, 4)] == [2, 4, 8, 10]
+    assert isinstance(results[2], ValueError)
+    # One failed batch, then each item retried on its own.
+    assert batcher.batches == [[1, 2, -3, 4, 5], [1], [2], [-3], [4], [5]]
+
+
+def test_subclass_must_implement_process_batch():
+    class Incomplete(AsyncBatcher):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_user_create_batcher_isolates_duplicate_email(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.exc import IntegrityError
+
+    from FastAPIBig.orm.base.base_model import DECLARATIVE_BASE, ORMSession
+    from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
+    from examples.my_project.app.posts.models import Post  # noqa: F401
+    from examples.my_project.app.users.models import User
+    from examples.my_project.app.users.routes import UserCreateBatcher
+
+    rows = [{"name": f"user{i}", "email": f"user{i}@example.com"} for i in range(5)]
+    rows.insert(3, {"name": "dup", "email": "user0@example.com"})
+
+    async def run():
+        db_manager = DataBaseSessionManager(
+            f"sqlite+aiosqlite:///{tmp_path}/db.sqlite3"
+        )
+        previous = ORMSession._db_manager
+        ORMSession.initialize(db_manager)
+        try:
+            await db_manager.create_all_tables(DECLARATIVE_BASE)
+            batcher = UserCreateBatcher(flush_interval=0.01)
+            results = await _gather(batcher, rows)
+            stored = await User.objects.all()
+            return results, stored
+        finally:
+            ORMSession._db_manager = previous
+            await db_manager.close()
+
+    results, stored = asyncio.run(run())
+
+    assert isinstance(results[3], IntegrityError)
+    created = results[:3] + results[4:]
+    assert [user.email for user in created] == [
+        f"user{i}@example.com" for i in range(5)
+    ]
+    assert sorted(user.email for user in stored) == sorted(
+        user.email for user in created
+    )
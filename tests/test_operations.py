@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+
+def test_failed_commit_fails_the_write_request(tmp_path, monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("aiosqlite")
+    from fastapi import FastAPI
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from FastAPIBig.orm.base.base_model import DECLARATIVE_BASE, ORMSession
+    from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
+    from FastAPIBig.views.apis.operations import APIView
+    from examples.my_project.app.posts.models import Post  # noqa: F401
+    from examples.my_project.app.users.models import User
+    from examples.my_project.app.users.schemas import UserSchemaIn, UserSchemaOut
+
+    class UserView(APIView):
+        model = User
+        schema_in = UserSchemaIn
+        schema_out = UserSchemaOut
+        methods = ["create", "list"]
+
+    app = FastAPI()
+    app.include_router(UserView.as_router(prefix="/users"))
+
+    async def failing_commit(self):
+        raise RuntimeError("commit failed")
+
+    async def run():
+        db_manager = DataBaseSessionManager(
+            f"sqlite+aiosqlite:///{tmp_path}/db.sqlite3"
+        )
+        previous = ORMSession._db_manager
+        ORMSession.initialize(db_manager)
+        try:
+            await db_manager.create_all_tables(DECLARATIVE_BASE)
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                with monkeypatch.context() as patch:
+                    patch.setattr(AsyncSession, "commit", failing_commit)
+                    created = await client.post(
+                        "/users/", json={"name": "a", "email": "a@example.com"}
+                    )
+                listed = await client.get("/users/")
+            return created, listed
+        finally:
+            ORMSession._db_manager = previous
+            await db_manager.close()
+
+    created, listed = asyncio.run(run())
+
+    # The commit runs before the response, so its failure reaches the client.
+    assert created.status_code == 500
+    assert listed.json() == []
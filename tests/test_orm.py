@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+
+def test_interleaved_saves_keep_both_updates(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from FastAPIBig.orm.base.base_model import DECLARATIVE_BASE, ORMSession
+    from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
+    from examples.my_project.app.posts.models import Post  # noqa: F401
+    from examples.my_project.app.users.models import User
+
+    async def run():
+        db_manager = DataBaseSessionManager(
+            f"sqlite+aiosqlite:///{tmp_path}/db.sqlite3"
+        )
+        previous = ORMSession._db_manager
+        ORMSession.initialize(db_manager)
+        try:
+            await db_manager.create_all_tables(DECLARATIVE_BASE)
+            user = await User.objects.create(name="orig", email="orig@example.com")
+
+            # Two PATCH requests load the row, then each saves a different column.
+            async with db_manager.async_session() as session_a:
+                async with db_manager.async_session() as session_b:
+                    user_a = await User.objects(session_a).get(user.id)
+                    user_b = await User.objects(session_b).get(user.id)
+                    user_a.name = "newname"
+                    await User.objects(session_a).save(user_a)
+                    await session_a.commit()
+                    user_b.email = "new@example.com"
+                    await User.objects(session_b).save(user_b)
+
+            return await User.objects.get(user.id)
+        finally:
+            ORMSession._db_manager = previous
+            await db_manager.close()
+
+    stored = asyncio.run(run())
+
+    assert (stored.name, stored.email) == ("newname", "new@example.com")
+
+
+def test_update_without_values_returns_the_instance(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from FastAPIBig.orm.base.base_model import DECLARATIVE_BASE, ORMSession
+    from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
+    from examples.my_project.app.posts.models import Post  # noqa: F401
+    from examples.my_project.app.users.models import User
+
+    async def run():
+        db_manager = DataBaseSessionManager(
+            f"sqlite+aiosqlite:///{tmp_path}/db.sqlite3"
+        )
+        previous = ORMSession._db_manager
+        ORMSession.initialize(db_manager)
+        try:
+            await db_manager.create_all_tables(DECLARATIVE_BASE)
+            user = await User.objects.create(name="orig", email="orig@example.com")
+            return user.id, await User.objects.update(user.id)
+        finally:
+            ORMSession._db_manager = previous
+            await db_manager.close()
+
+    user_id, updated = asyncio.run(run())
+
+    assert (updated.id, updated.name) == (user_id, "orig")